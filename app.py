@@ -1,3 +1,5 @@
+import asyncio
+
 from textual.app import App, ComposeResult
 from textual.widgets import Header, Footer, Static, DataTable
 from textual.containers import Container
@@ -5,111 +7,141 @@ from textual.reactive import reactive
 from textual.coordinate import Coordinate
 from textual import events
 from textual.widgets import ListView, ListItem
+from typing import Dict, List, Optional, Tuple
 
 from league import League
 from league_stats import LeagueStats
 
 
+STATS_LEFT_COLUMN_WIDTH = 35
+STATS_INITIAL_ROWS = 20
+STATS_ROWS_PER_REFRESH = 16
+
+
+def _name_count(entry: Optional[Tuple], default_name: str = "N/A") -> Tuple[str, int]:
+    """
+    Unpacks a (competitor, count) stats entry into a display name and count.
+    """
+    if not entry:
+        return default_name, 0
+    competitor, count = entry
+    return (competitor.name if competitor else default_name), count
+
+
 class LeaderboardTable(DataTable):
-    def update_leaderboard(self, league: League):
-        self.clear(True)
-        self.add_columns("Rank", "Competitor", "Score",
-                         "# Rounds", "Avg Score")
-        leaderboard = league.get_leaderboard()
-        for rank, entry, in enumerate(leaderboard, 1):
-            self.add_row(
+    def update_leaderboard(self, leaderboard: List[Dict]):
+        rows = [
+            (
                 str(rank),
                 entry['name'],
                 str(entry['score']),
                 str(entry['rounds']),
-                str(f"{entry['avg_score']:.1f}"),
+                f"{entry['avg_score']:.1f}",
             )
+            for rank, entry in enumerate(leaderboard, 1)
+        ]
+        with self.app.batch_update():
+            # Columns never change, so they are only defined the first time
+            self.clear()
+            if not self.columns:
+                self.add_columns("Rank", "Competitor", "Score",
+                                 "# Rounds", "Avg Score")
+            self.add_rows(rows)
 
 
 class RoundsTable(DataTable):
     def update_rounds(self, league: League):
-        self.clear(True)
-        self.add_columns("Name", "Description")
-        for r in league.rounds.get_all():
-            self.add_row(r.name, r.description)
+        rows = [(r.name, r.description) for r in league.rounds.get_all()]
+        with self.app.batch_update():
+            self.clear()
+            if not self.columns:
+                self.add_columns("Name", "Description")
+            self.add_rows(rows)
 
 
 class CompetitorStats(ListView):
-    def update_stats(self, league: League, league_stats: LeagueStats, competitor):
-        stats = league_stats.competitor_stats(competitor.id)
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pending_lines: List[str] = []
+        self._render_generation = 0
+
+    def update_stats(self, league: League, stats: Dict, competitor):
         best_submission, best_points = stats['best_submission'] if stats['best_submission'] else (
             None, None)
-        most_often_voted_for = stats['most_often_voted_for'][0].name if stats[
-            'most_often_voted_for'] and stats['most_often_voted_for'][0] else "N/A"
-        most_often_voted_for_count = stats['most_often_voted_for'][1] if stats['most_often_voted_for'] else 0
-        most_often_votes_from = stats['most_often_votes_from'][0].name if stats[
-            'most_often_votes_from'] and stats['most_often_votes_from'][0] else "N/A"
-        most_often_votes_from_count = stats['most_often_votes_from'][1] if stats['most_often_votes_from'] else 0
-        most_points_given_to = stats['most_points_given_to'][0].name if stats[
-            'most_points_given_to'] and stats['most_points_given_to'][0] else "N/A"
-        most_points_given_to_count = stats['most_points_given_to'][1] if stats['most_points_given_to'] else 0
-        most_points_from = stats['most_points_from'][0].name if stats[
-            'most_points_from'] and stats['most_points_from'][0] else "N/A"
-        most_points_from_count = stats['most_points_from'][1] if stats['most_points_from'] else 0
+        most_often_voted_for, most_often_voted_for_count = _name_count(
+            stats['most_often_voted_for'])
+        most_often_votes_from, most_often_votes_from_count = _name_count(
+            stats['most_often_votes_from'])
+        most_points_given_to, most_points_given_to_count = _name_count(
+            stats['most_points_given_to'])
+        most_points_from, most_points_from_count = _name_count(
+            stats['most_points_from'])
 
         points_received_by_player = stats.get('points_received_by_player', {})
         points_given_to_player = stats.get('points_given_to_player', {})
 
-        received_lines = []
-        given_lines = []
+        by_id = league.competitors.get_id_map()
 
         if points_received_by_player:
-            received_lines.append("Points received from each player:")
-            for voter_id, points in points_received_by_player.items():
-                voter = league.competitors.get_by_id(voter_id)
-                voter_name = voter.name if voter else voter_id
-                received_lines.append(f"{voter_name}: {points}")
+            received_lines = ["Points received from each player:"]
+            received_lines += [f"{by_id[voter_id].name if voter_id in by_id else voter_id}: {points}"
+                               for voter_id, points in points_received_by_player.items()]
         else:
-            received_lines.append("Points received from each player: None")
+            received_lines = ["Points received from each player: None"]
 
         if points_given_to_player:
-            given_lines.append("Points given to each player:")
-            for submitter_id, points in points_given_to_player.items():
-                submitter = league.competitors.get_by_id(submitter_id)
-                submitter_name = submitter.name if submitter else submitter_id
-                given_lines.append(f"{submitter_name}: {points}")
+            given_lines = ["Points given to each player:"]
+            given_lines += [f"{by_id[submitter_id].name if submitter_id in by_id else submitter_id}: {points}"
+                            for submitter_id, points in points_given_to_player.items()]
         else:
-            given_lines.append("Points given to each player: None")
+            given_lines = ["Points given to each player: None"]
 
         max_len = max(len(received_lines), len(given_lines))
         received_lines += [""] * (max_len - len(received_lines))
         given_lines += [""] * (max_len - len(given_lines))
 
         side_by_side = [
-            f"{left:<35}   {right}"
+            left.ljust(STATS_LEFT_COLUMN_WIDTH) + "   " + right
             for left, right in zip(received_lines, given_lines)
         ]
 
-        # Clear and repopulate the ListView
+        lines = [
+            f"[b]{competitor.name}[/b]",
+            f"Total Votes Received: {stats['total_votes_received']}",
+            f"Rounds Participated: {stats['rounds_participated']}",
+            "",
+            f"Best Submission: {getattr(best_submission, 'title', 'N/A')} ({best_points} pts)",
+            f"Average Score Per Round: {stats['avg_score_per_round']:.2f}",
+            "",
+            f"Voted Most Often For: {most_often_voted_for} ({most_often_voted_for_count} times)",
+            f"Voted Most Often From: {most_often_votes_from} ({most_often_votes_from_count} times)",
+            "",
+            f"Awarded the Most Points To: {most_points_given_to} ({most_points_given_to_count} pts)",
+            f"Received the Most Points From: {most_points_from} ({most_points_from_count} pts)",
+            "",
+        ]
+        lines.extend(side_by_side)
+
+        # Clear and repopulate the ListView. Only the first screenful is
+        # mounted immediately; the rest is appended over subsequent refreshes.
+        self._render_generation += 1
+        self._pending_lines = lines[STATS_INITIAL_ROWS:]
         self.clear()
-        self.append(ListItem(Static(f"[b]{competitor.name}[/b]")))
-        self.append(
-            ListItem(Static(f"Total Votes Received: {stats['total_votes_received']}")))
-        self.append(
-            ListItem(Static(f"Rounds Participated: {stats['rounds_participated']}")))
-        self.append(ListItem(Static("")))
-        self.append(ListItem(Static(
-            f"Best Submission: {getattr(best_submission, 'title', 'N/A')} ({best_points} pts)")))
-        self.append(ListItem(
-            Static(f"Average Score Per Round: {stats['avg_score_per_round']:.2f}")))
-        self.append(ListItem(Static("")))
-        self.append(ListItem(Static(
-            f"Voted Most Often For: {most_often_voted_for} ({most_often_voted_for_count} times)")))
-        self.append(ListItem(Static(
-            f"Voted Most Often From: {most_often_votes_from} ({most_often_votes_from_count} times)")))
-        self.append(ListItem(Static("")))
-        self.append(ListItem(Static(
-            f"Awarded the Most Points To: {most_points_given_to} ({most_points_given_to_count} pts)")))
-        self.append(ListItem(Static(
-            f"Received the Most Points From: {most_points_from} ({most_points_from_count} pts)")))
-        self.append(ListItem(Static("")))
-        for line in side_by_side:
-            self.append(ListItem(Static(line)))
+        self.extend(ListItem(Static(line))
+                    for line in lines[:STATS_INITIAL_ROWS])
+        if self._pending_lines:
+            self.call_after_refresh(
+                self._append_pending, self._render_generation)
+
+    def _append_pending(self, generation: int):
+        if generation != self._render_generation:
+            # A newer update_stats call has replaced the pending lines.
+            return
+        chunk = self._pending_lines[:STATS_ROWS_PER_REFRESH]
+        self._pending_lines = self._pending_lines[STATS_ROWS_PER_REFRESH:]
+        self.extend(ListItem(Static(line)) for line in chunk)
+        if self._pending_lines:
+            self.call_after_refresh(self._append_pending, generation)
 
 
 class LeagueApp(App):
@@ -130,8 +162,14 @@ class LeagueApp(App):
         self.rounds_table = RoundsTable()
         self.status = Static(
             "Press 'l' for leaderboard, 'r' for rounds, or 'q' to quit.")
-        self.main_container = Container()
         self.stats_panel = CompetitorStats()
+        # All views are mounted once; switching views only toggles display.
+        self.main_container = Container(
+            self.leaderboard_table, self.rounds_table, self.stats_panel)
+        self._leaderboard_cache: Optional[List[Dict]] = None
+        self._stats_cache: Dict[str, Dict] = {}
+        self._leaderboard_dirty = True
+        self._rounds_dirty = True
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -141,40 +179,42 @@ class LeagueApp(App):
 
     async def on_mount(self):
         await self.action_show_leaderboard()
+        self.run_worker(self._precompute_all_stats(), exclusive=True)
 
     async def action_show_leaderboard(self):
         self.view_mode = "leaderboard"
         self.status.update(
             "Leaderboard view. Use arrows, Enter or click for stats, 'r' for rounds.")
-        self.leaderboard_table.update_leaderboard(self.league)
-        await self.main_container.remove_children()
-        await self.main_container.mount(self.leaderboard_table)
+        if self._leaderboard_dirty:
+            self.leaderboard_table.update_leaderboard(self._get_leaderboard())
+            if self.leaderboard_table.row_count > 0:
+                self.leaderboard_table.cursor_type = "row"
+                self.leaderboard_table.cursor_coordinate = Coordinate(0, 0)
+            self._leaderboard_dirty = False
+        self._show_view(self.leaderboard_table)
         self.leaderboard_table.focus()
-        if self.leaderboard_table.row_count > 0:
-            self.leaderboard_table.cursor_type = "row"
-            self.leaderboard_table.cursor_coordinate = Coordinate(0, 0)
 
     async def action_show_rounds(self):
         self.view_mode = "rounds"
         self.status.update("Rounds view. Press 'l' for leaderboard.")
-        self.rounds_table.update_rounds(self.league)
-        await self.main_container.remove_children()
-        await self.main_container.mount(self.rounds_table)
+        if self._rounds_dirty:
+            self.rounds_table.update_rounds(self.league)
+            if self.rounds_table.row_count > 0:
+                self.rounds_table.cursor_type = "row"
+                self.rounds_table.cursor_coordinate = Coordinate(0, 0)
+            self._rounds_dirty = False
+        self._show_view(self.rounds_table)
         self.rounds_table.focus()
-        if self.rounds_table.row_count > 0:
-            self.rounds_table.cursor_type = "row"
-            self.rounds_table.cursor_coordinate = Coordinate(0, 0)
 
     async def action_show_stats(self, competitor_idx: int):
-        leaderboard = self.league.get_leaderboard()
+        leaderboard = self._get_leaderboard()
         if 0 <= competitor_idx < len(leaderboard):
             competitor = leaderboard[competitor_idx]['competitor']
             self.status.update(
                 f"Stats for {competitor.name}. Press Esc to return.")
-            await self.main_container.remove_children()
-            await self.main_container.mount(self.stats_panel)
+            self._show_view(self.stats_panel)
             self.stats_panel.update_stats(
-                self.league, self.league_stats, competitor)
+                self.league, self._get_competitor_stats(competitor.id), competitor)
             self.stats_panel.focus()
             self.view_mode = "stats"
 
@@ -196,6 +236,31 @@ class LeagueApp(App):
         row = self.leaderboard_table.cursor_row
         await self.action_show_stats(row)
 
+    def _show_view(self, view) -> None:
+        for widget in (self.leaderboard_table, self.rounds_table, self.stats_panel):
+            widget.display = widget is view
+
+    def _get_leaderboard(self) -> List[Dict]:
+        # The league is read-only for the lifetime of the app, so the
+        # leaderboard only needs computing once.
+        if self._leaderboard_cache is None:
+            self._leaderboard_cache = self.league.get_leaderboard()
+        return self._leaderboard_cache
+
+    def _get_competitor_stats(self, competitor_id: str) -> Dict:
+        stats = self._stats_cache.get(competitor_id)
+        if stats is None:
+            stats = self.league_stats.competitor_stats(competitor_id)
+            self._stats_cache[competitor_id] = stats
+        return stats
+
+    async def _precompute_all_stats(self):
+        # Warm the stats cache in the background, yielding between
+        # competitors so the UI stays responsive.
+        for entry in self._get_leaderboard():
+            self._get_competitor_stats(entry['competitor'].id)
+            await asyncio.sleep(0)
+
 
 if __name__ == "__main__":
     league = League(
@@ -8,7 +8,9 @@ removal, and retrieval.
 """
 
 import csv
-from typing import List, Optional
+import os
+import sys
+from typing import Dict, Iterable, List, Optional, Tuple
 
 
 class Competitor:
@@ -16,8 +18,10 @@ class Competitor:
     Represents a competitor with an ID and name.
     """
 
+    __slots__ = ('id', 'name')
+
     def __init__(self, competitor_id: str, name: str) -> None:
-        self.id = competitor_id
+        self.id = sys.intern(competitor_id)
         self.name = name
 
     def __repr__(self) -> str:
@@ -32,11 +36,21 @@ class CompetitorsManager:
     # Special Methods
     ############################################################################
 
-    def __init__(self, csv_path: str) -> None:
+    def __init__(self, csv_path: str, autosave: bool = True) -> None:
         self.csv_path = csv_path
+        self.autosave = autosave
         self.competitors = []
+        self._by_id: Dict[str, Competitor] = {}
+        self._by_name: Dict[str, Competitor] = {}
+        self._dirty = False
         self._load_competitors()
 
+    def __enter__(self) -> 'CompetitorsManager':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
     ############################################################################
     # Public Methods
     ############################################################################
@@ -44,19 +58,13 @@ class CompetitorsManager:
         """
         Returns the first Competitor with the given ID, or None if not found.
         """
-        for competitor in self.competitors:
-            if competitor.id == competitor_id:
-                return competitor
-        return None
+        return self._by_id.get(competitor_id)
 
     def get_by_name(self, name: str) -> Optional[Competitor]:
         """
         Returns the first Competitor with the given name, or None if not found.
         """
-        for competitor in self.competitors:
-            if competitor.name == name:
-                return competitor
-        return None
+        return self._by_name.get(name)
 
     def get_all(self) -> List[Competitor]:
         """
@@ -64,17 +72,38 @@ class CompetitorsManager:
         """
         return self.competitors
 
+    def get_id_map(self) -> Dict[str, Competitor]:
+        """
+        Returns a mapping of competitor ID to Competitor.
+        """
+        return self._by_id
+
     def add_competitor(self, competitor_id: str, name: str) -> Optional[Competitor]:
         """
         Adds a new competitor with the given ID and name.
         """
         if self.get_by_id(competitor_id) is None:
             competitor = Competitor(competitor_id, name)
-            self.competitors.append(competitor)
-            self._save_competitors()
+            self._index(competitor)
+            self._mark_dirty()
             return competitor
         return None
 
+    def add_many(self, competitors: Iterable[Tuple[str, str]]) -> List[Competitor]:
+        """
+        Adds each (ID, name) pair whose ID is not already present.
+        Returns the list of competitors that were added.
+        """
+        added = []
+        for competitor_id, name in competitors:
+            if competitor_id not in self._by_id:
+                competitor = Competitor(competitor_id, name)
+                self._index(competitor)
+                added.append(competitor)
+        if added:
+            self._mark_dirty()
+        return added
+
     def remove_competitor(self, competitor_id: str) -> bool:
         """
         Removes the competitor with the given ID.
@@ -82,27 +111,70 @@ class CompetitorsManager:
         """
         competitor = self.get_by_id(competitor_id)
         if competitor:
-            self.competitors.remove(competitor)
-            self._save_competitors()
+            self._unindex(competitor)
+            self._mark_dirty()
             return True
         return False
 
+    def flush(self) -> None:
+        """
+        Writes pending changes to the CSV file, if there are any.
+        """
+        if self._dirty:
+            self._save_competitors()
+            self._dirty = False
+
+    def close(self) -> None:
+        """
+        Flushes any pending changes. Called automatically when used as a context manager.
+        """
+        self.flush()
+
     ############################################################################
     # Private Methods
     ############################################################################
+    def _mark_dirty(self) -> None:
+        self._dirty = True
+        if self.autosave:
+            self.flush()
+
+    def _index(self, competitor: Competitor) -> None:
+        self.competitors.append(competitor)
+        self._by_id.setdefault(competitor.id, competitor)
+        self._by_name.setdefault(competitor.name, competitor)
+
+    def _unindex(self, competitor: Competitor) -> None:
+        self.competitors.remove(competitor)
+        for index, attr in ((self._by_id, 'id'), (self._by_name, 'name')):
+            key = getattr(competitor, attr)
+            if index.get(key) is competitor:
+                del index[key]
+                # Fall back to the next competitor sharing the key, if any
+                for other in self.competitors:
+                    if getattr(other, attr) == key:
+                        index[key] = other
+                        break
+
     def _save_competitors(self) -> None:
-        with open(self.csv_path, 'w', newline='', encoding='utf-8') as csvfile:
+        # Write to a temporary file and swap it in, so a crash mid-write
+        # never leaves a truncated CSV behind.
+        tmp_path = self.csv_path + '.tmp'
+        with open(tmp_path, 'w', newline='', encoding='utf-8', buffering=1 << 16) as csvfile:
             writer = csv.writer(csvfile)
             writer.writerow(['ID', 'Name'])
-            for competitor in self.competitors:
-                writer.writerow([competitor.id, competitor.name])
+            writer.writerows((c.id, c.name) for c in self.competitors)
+        os.replace(tmp_path, self.csv_path)
 
     def _load_competitors(self) -> None:
         with open(self.csv_path, newline='', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
+            reader = csv.reader(csvfile)
+            header = next(reader, None)
+            if header is None:
+                return
+            id_col, name_col = header.index('ID'), header.index('Name')
             for row in reader:
-                competitor = Competitor(row['ID'], row['Name'])
-                self.competitors.append(competitor)
+                if row:
+                    self._index(Competitor(row[id_col], row[name_col]))
 
 
 # Example usage
@@ -0,0 +1,31 @@
+"""
+csv_utils.py
+
+This module defines helpers shared by the CSV-backed managers.
+"""
+
+import csv
+import os
+from typing import Callable, Iterable
+
+
+def append_csv_row(csv_path: str, header_writer: Callable, row: Iterable[str]) -> None:
+    """
+    Appends a single row to the given CSV file. An empty file gets the
+    header first, written by calling header_writer with the csv writer.
+    """
+    with open(csv_path, 'a', newline='', encoding='utf-8') as csvfile:
+        writer = csv.writer(csvfile)
+        # Only a brand new (empty) file needs the header
+        if csvfile.tell() == 0:
+            header_writer(writer)
+        elif not _ends_with_newline(csv_path):
+            # Don't glue the new row onto an unterminated last line
+            csvfile.write(writer.dialect.lineterminator)
+        writer.writerow(row)
+
+
+def _ends_with_newline(csv_path: str) -> bool:
+    with open(csv_path, 'rb') as csvfile:
+        csvfile.seek(-1, os.SEEK_END)
+        return csvfile.read(1) == b'\n'
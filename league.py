@@ -10,7 +10,10 @@ from competitor import CompetitorsManager, Competitor
 from round import RoundsManager, Round
 from submission import SubmissionsManager, Submission
 from vote import VotesManager, Vote
-from typing import List, Optional, Dict
+from collections import Counter, defaultdict
+from operator import attrgetter
+import heapq
+from typing import List, Optional, Dict, Set
 
 
 class League:
@@ -30,6 +33,11 @@ class League:
         self.rounds = RoundsManager(rounds_csv)
         self.submissions = SubmissionsManager(submissions_csv)
         self.votes = VotesManager(votes_csv)
+        self._aggregates_version: Optional[tuple] = None
+        self._uri_points: Dict[str, int] = {}
+        self._voter_points: Dict[str, int] = {}
+        self._competitor_score: Dict[str, int] = {}
+        self._competitor_rounds: Dict[str, int] = {}
 
     ############################################################################
     # Public Methods
@@ -42,18 +50,21 @@ class League:
         return self.submissions.get_by_round_id(round_id)
 
     def get_votes_by_round(self, round_id: str) -> List[Vote]:
-        return self.votes.get_by_round_id(round_id)
+        return list(self.votes.get_by_round_id(round_id))
 
     def get_votes_by_competitor(self, competitor_id: str) -> List[Vote]:
         """
         Get all votes for all submissions by a competitor.
         """
-        competitor_subs = self.get_submissions_by_competitor(competitor_id)
-        uris = {s.spotify_uri for s in competitor_subs}
-        return [v for v in self.votes.get_all() if v.spotify_uri in uris]
+        uris = {s.spotify_uri for s in self.get_submissions_by_competitor(competitor_id)}
+        # Each index bucket is in file order; merge them so the result is
+        # too, since competitor_stats breaks ties on it
+        return list(heapq.merge(
+            *(self.votes.get_by_spotify_uri(uri) for uri in uris),
+            key=attrgetter('seq')))
 
     def get_votes_for_submission(self, spotify_uri: str) -> List[Vote]:
-        return self.votes.get_by_spotify_uri(spotify_uri)
+        return list(self.votes.get_by_spotify_uri(spotify_uri))
 
     def get_rounds_for_competitor(self, competitor_id: str) -> List[Round]:
         """
@@ -82,35 +93,47 @@ class League:
         """
         Sum all points assigned to all submissions by this competitor.
         """
-        votes = self.get_votes_by_competitor(competitor_id)
-        return sum(int(v.points_assigned) for v in votes if str(v.points_assigned).isdigit())
+        self._ensure_aggregates()
+        return self._competitor_score.get(competitor_id, 0)
 
     def tally_scores_by_round(self, round_id: str) -> Dict[str, int]:
         """
         Returns a dict mapping competitor_id to their total score in a round.
         """
-        subs = self.get_submissions_by_round(round_id)
-        scores: Dict[str, int] = {}
-        for sub in subs:
-            votes = self.get_votes_for_submission(sub.spotify_uri)
-            total = sum(int(v.points_assigned)
-                        for v in votes if str(v.points_assigned).isdigit())
-            scores[sub.submitter_id] = scores.get(sub.submitter_id, 0) + total
+        self._ensure_aggregates()
+        scores: Dict[str, int] = Counter()
+        for sub in self.get_submissions_by_round(round_id):
+            scores[sub.submitter_id] += self._uri_points.get(sub.spotify_uri, 0)
         return scores
 
+    def get_points_by_uri(self) -> Dict[str, int]:
+        """
+        Returns a dict mapping Spotify URI to the total points it received.
+        """
+        self._ensure_aggregates()
+        return self._uri_points
+
+    def get_points_by_voter(self) -> Dict[str, int]:
+        """
+        Returns a dict mapping voter_id to the total points they have given out.
+        """
+        self._ensure_aggregates()
+        return self._voter_points
+
     def get_leaderboard(self) -> List[Dict]:
         """
         Returns a sorted list of competitors and their total scores, descending.
         """
+        self._ensure_aggregates()
         leaderboard = []
         for competitor in self.competitors.get_all():
-            score = self.tally_competitor_score(competitor.id)
-            rounds = len(self.get_rounds_for_competitor(competitor.id))
+            score = self._competitor_score.get(competitor.id, 0)
+            rounds = self._competitor_rounds.get(competitor.id, 0)
             avg_score_per_round = score / rounds if rounds else 0
             leaderboard.append({
                 'competitor': competitor,
                 'score': score,
-                'rounds': len(self.get_rounds_for_competitor(competitor.id)),
+                'rounds': rounds,
                 'avg_score': avg_score_per_round,
                 'name': competitor.name
             })
@@ -127,12 +150,61 @@ class League:
         return self.submissions.get_by_spotify_uri(spotify_uri)
 
     def get_vote(self, spotify_uri: str, voter_id: str, round_id: str) -> Optional[Vote]:
-        votes = self.votes.get_by_spotify_uri(spotify_uri)
-        for v in votes:
+        for v in self.votes.get_by_spotify_uri(spotify_uri):
             if v.voter_id == voter_id and v.round_id == round_id:
                 return v
         return None
 
+    def invalidate(self) -> None:
+        """
+        Discards cached aggregates so they are rebuilt on next use.
+        Only needed if Vote/Submission/Round objects are edited in place;
+        adds and removes through the managers are picked up automatically.
+        """
+        self._aggregates_version = None
+
+    ############################################################################
+    # Private Methods
+    ############################################################################
+
+    def _ensure_aggregates(self) -> None:
+        if self._data_version() == self._aggregates_version:
+            return
+
+        # A single fused pass over votes and one over submissions feeds
+        # every tally
+        uri_points: Dict[str, int] = Counter()
+        voter_points: Dict[str, int] = Counter()
+        for vote in self.votes.get_all():
+            if vote.points is not None:
+                uri_points[vote.spotify_uri] += vote.points
+                voter_points[vote.voter_id] += vote.points
+
+        submitter_uris: Dict[str, Set[str]] = defaultdict(set)
+        submitter_rounds: Dict[str, Set[str]] = defaultdict(set)
+        for sub in self.submissions.get_all():
+            submitter_uris[sub.submitter_id].add(sub.spotify_uri)
+            if self.rounds.get_by_id(sub.round_id) is not None:
+                submitter_rounds[sub.submitter_id].add(sub.round_id)
+
+        self._uri_points = uri_points
+        self._voter_points = voter_points
+        self._competitor_score = {
+            submitter_id: sum(uri_points.get(uri, 0) for uri in uris)
+            for submitter_id, uris in submitter_uris.items()
+        }
+        self._competitor_rounds = {
+            submitter_id: len(round_ids)
+            for submitter_id, round_ids in submitter_rounds.items()
+        }
+        # Read the version after the passes above, since the votes are only
+        # loaded (bumping their version) on first access.
+        self._aggregates_version = self._data_version()
+
+    def _data_version(self) -> tuple:
+        return (self.rounds.version,
+                self.submissions.version, self.votes.version)
+
 
 # Example usage
 if __name__ == "__main__":
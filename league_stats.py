@@ -15,10 +15,7 @@ class LeagueStats:
         """
         Returns the Spotify URI and vote count of the submission with the most votes.
         """
-        vote_counts: Dict[str, int] = {}
-        for vote in self.league.votes.get_all():
-            vote_counts[vote.spotify_uri] = vote_counts.get(
-                vote.spotify_uri, 0) + 1
+        vote_counts = self.league.votes.count_by_uri()
         if not vote_counts:
             return None
         most_voted = max(vote_counts.items(), key=lambda x: x[1])
@@ -28,11 +25,7 @@ class LeagueStats:
         """
         Returns the Spotify URI and total points of the highest scoring submission.
         """
-        score_counts: Dict[str, int] = {}
-        for vote in self.league.votes.get_all():
-            if str(vote.points_assigned).isdigit():
-                score_counts[vote.spotify_uri] = score_counts.get(
-                    vote.spotify_uri, 0) + int(vote.points_assigned)
+        score_counts = self.league.get_points_by_uri()
         if not score_counts:
             return None
         highest = max(score_counts.items(), key=lambda x: x[1])
@@ -42,16 +35,14 @@ class LeagueStats:
         """
         Returns a dict mapping competitor_id to their average points per submission.
         """
+        uri_points = self.league.get_points_by_uri()
         averages: Dict[str, float] = {}
         for competitor in self.league.competitors.get_all():
             subs = self.league.get_submissions_by_competitor(competitor.id)
             if not subs:
                 continue
-            total_points = sum(
-                sum(int(v.points_assigned) for v in self.league.get_votes_for_submission(
-                    sub.spotify_uri) if str(v.points_assigned).isdigit())
-                for sub in subs
-            )
+            total_points = sum(uri_points.get(sub.spotify_uri, 0)
+                               for sub in subs)
             averages[competitor.id] = total_points / len(subs)
         return averages
 
@@ -59,11 +50,7 @@ class LeagueStats:
         """
         Returns the voter_id who has given out the most total points.
         """
-        voter_points: Dict[str, int] = {}
-        for vote in self.league.votes.get_all():
-            if str(vote.points_assigned).isdigit():
-                voter_points[vote.voter_id] = voter_points.get(
-                    vote.voter_id, 0) + int(vote.points_assigned)
+        voter_points = self.league.get_points_by_voter()
         if not voter_points:
             return None
         return max(voter_points.items(), key=lambda x: x[1])
@@ -72,11 +59,7 @@ class LeagueStats:
         """
         Returns the voter_id who has given out the fewest total points (but has voted).
         """
-        voter_points: Dict[str, int] = {}
-        for vote in self.league.votes.get_all():
-            if str(vote.points_assigned).isdigit():
-                voter_points[vote.voter_id] = voter_points.get(
-                    vote.voter_id, 0) + int(vote.points_assigned)
+        voter_points = self.league.get_points_by_voter()
         if not voter_points:
             return None
         return min(voter_points.items(), key=lambda x: x[1])
@@ -86,25 +69,42 @@ class LeagueStats:
         Returns a dictionary of interesting stats for a specific competitor.
         """
         stats = {}
+        get_competitor = self.league.competitors.get_by_id
+
+        # Pass over the votes this competitor cast: count and points per submitter
+        cast_counts: Counter = Counter()
+        cast_points: Counter = Counter()
+        for vote in self.league.votes.get_by_voter_id(competitor_id):
+            sub = self.league.get_submission_by_uri(vote.spotify_uri)
+            if sub:
+                cast_counts[sub.submitter_id] += 1
+                if vote.points is not None:
+                    cast_points[sub.submitter_id] += vote.points
+
+        # Pass over the votes this competitor received: count and points per
+        # voter, plus points per submission for the best-submission lookup
+        recv_counts: Counter = Counter()
+        recv_points: Counter = Counter()
+        uri_points: Counter = Counter()
+        for vote in self.league.get_votes_by_competitor(competitor_id):
+            recv_counts[vote.voter_id] += 1
+            if vote.points is not None:
+                recv_points[vote.voter_id] += vote.points
+                uri_points[vote.spotify_uri] += vote.points
+        total_points = sum(recv_points.values())
+
         # Total number of votes received (all submissions)
-        votes_received = self.league.get_votes_by_competitor(competitor_id)
-        stats['total_votes_received'] = self.league.tally_competitor_score(
-            competitor_id)
+        stats['total_votes_received'] = total_points
 
         # Total number of rounds participated in
         rounds = self.league.get_rounds_for_competitor(competitor_id)
         stats['rounds_participated'] = len(rounds)
 
-        # All submissions by this competitor
-        submissions = self.league.get_submissions_by_competitor(competitor_id)
-
         # Best submission (by total points)
         best_submission = None
         best_points = -1
-        for sub in submissions:
-            votes = self.league.get_votes_for_submission(sub.spotify_uri)
-            points = sum(int(v.points_assigned)
-                         for v in votes if str(v.points_assigned).isdigit())
+        for sub in self.league.get_submissions_by_competitor(competitor_id):
+            points = uri_points.get(sub.spotify_uri, 0)
             if points > best_points:
                 best_points = points
                 best_submission = sub
@@ -112,76 +112,48 @@ class LeagueStats:
             best_submission, best_points) if best_submission else None
 
         # The person they voted for the most (by count)
-        votes_cast = []
-        points_given = {}
-        for vote in self.league.votes.get_by_voter_id(competitor_id):
-            sub = self.league.get_submission_by_uri(vote.spotify_uri)
-            if sub:
-                votes_cast.append(sub.submitter_id)
-                # Track points given to each submitter
-                if str(vote.points_assigned).isdigit():
-                    points_given[sub.submitter_id] = points_given.get(
-                        sub.submitter_id, 0) + int(vote.points_assigned)
-        if votes_cast:
-            most_often_voted_for_id, count = Counter(
-                votes_cast).most_common(1)[0]
-            most_often_voted_for = self.league.competitors.get_by_id(
-                most_often_voted_for_id)
-            stats['most_often_voted_for'] = (most_often_voted_for, count)
+        if cast_counts:
+            most_often_voted_for_id, count = cast_counts.most_common(1)[0]
+            stats['most_often_voted_for'] = (
+                get_competitor(most_often_voted_for_id), count)
         else:
             stats['most_often_voted_for'] = None
 
         # The person they gave the most points to (by sum of points)
-        if points_given:
-            most_points_given_id = max(points_given, key=points_given.get)
-            most_points_given_to = self.league.competitors.get_by_id(
-                most_points_given_id)
+        if cast_points:
+            most_points_given_id = max(cast_points, key=cast_points.get)
             stats['most_points_given_to'] = (
-                most_points_given_to, points_given[most_points_given_id])
+                get_competitor(most_points_given_id), cast_points[most_points_given_id])
         else:
             stats['most_points_given_to'] = None
 
         # The person who voted for them the most (by count)
-        received_from = []
-        points_received_from = {}
-        for vote in votes_received:
-            received_from.append(vote.voter_id)
-            # Track points received from each voter
-            if str(vote.points_assigned).isdigit():
-                points_received_from[vote.voter_id] = points_received_from.get(
-                    vote.voter_id, 0) + int(vote.points_assigned)
-        if received_from:
-            most_often_votes_from_id, count = Counter(
-                received_from).most_common(1)[0]
-            most_often_votes_from = self.league.competitors.get_by_id(
-                most_often_votes_from_id)
-            stats['most_often_votes_from'] = (most_often_votes_from, count)
+        if recv_counts:
+            most_often_votes_from_id, count = recv_counts.most_common(1)[0]
+            stats['most_often_votes_from'] = (
+                get_competitor(most_often_votes_from_id), count)
         else:
             stats['most_often_votes_from'] = None
 
         # The person who gave them the most points (by sum of points)
-        if points_received_from:
-            most_points_from_id = max(
-                points_received_from, key=points_received_from.get)
-            most_points_from = self.league.competitors.get_by_id(
-                most_points_from_id)
+        if recv_points:
+            most_points_from_id = max(recv_points, key=recv_points.get)
             stats['most_points_from'] = (
-                most_points_from, points_received_from[most_points_from_id])
+                get_competitor(most_points_from_id), recv_points[most_points_from_id])
         else:
             stats['most_points_from'] = None
 
         # Points received by player (sorted dict: voter_id -> points, remove 0s)
         stats['points_received_by_player'] = OrderedDict(
-            (k, v) for k, v in sorted(points_received_from.items(), key=lambda x: x[1], reverse=True) if v > 0
+            (k, v) for k, v in sorted(recv_points.items(), key=lambda x: x[1], reverse=True) if v > 0
         )
 
         # Points given to player (sorted dict: submitter_id -> points, remove 0s)
         stats['points_given_to_player'] = OrderedDict(
-            (k, v) for k, v in sorted(points_given.items(), key=lambda x: x[1], reverse=True) if v > 0
+            (k, v) for k, v in sorted(cast_points.items(), key=lambda x: x[1], reverse=True) if v > 0
         )
 
-        stats['avg_score_per_round'] = self.league.tally_competitor_score(
-            competitor_id) / len(rounds) if rounds else 0
+        stats['avg_score_per_round'] = total_points / len(rounds) if rounds else 0
 
         return stats
 
@@ -7,7 +7,11 @@ The CompetitorsManager class manages a list of competitors, allowing for additio
 """
 
 import csv
-from typing import List, Optional
+import sys
+from operator import itemgetter
+from typing import Dict, List, Optional
+
+from csv_utils import append_csv_row
 
 
 class Round:
@@ -15,8 +19,10 @@ class Round:
     Represents a game_round with an ID, time_created date, name, description, and playlist URL.
     """
 
+    __slots__ = ('id', 'time_created', 'name', 'description', 'playlist_url')
+
     def __init__(self, round_id: str, time_created: str, name: str, description: str, playlist_url: str) -> None:
-        self.id = round_id
+        self.id = sys.intern(round_id)
         self.time_created = time_created
         self.name = name
         self.description = description
@@ -35,11 +41,22 @@ class RoundsManager:
     # Special Methods
     ############################################################################
 
-    def __init__(self, csv_path: str) -> None:
+    def __init__(self, csv_path: str, autosave: bool = True) -> None:
         self.csv_path = csv_path
+        self.autosave = autosave
         self.rounds: List[Round] = []
+        self.version = 0
+        self._by_id: Dict[str, Round] = {}
+        self._by_name: Dict[str, Round] = {}
+        self._dirty = False
         self._load_rounds()
 
+    def __enter__(self) -> 'RoundsManager':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
     ############################################################################
     # Public Methods
     ############################################################################
@@ -47,19 +64,13 @@ class RoundsManager:
         """
         Returns the first Round with the given ID, or None if not found.
         """
-        for game_round in self.rounds:
-            if game_round.id == round_id:
-                return game_round
-        return None
+        return self._by_id.get(round_id)
 
     def get_by_name(self, name: str) -> Optional[Round]:
         """
         Returns the first Round with the given name, or None if not found.
         """
-        for game_round in self.rounds:
-            if game_round.name == name:
-                return game_round
-        return None
+        return self._by_name.get(name)
 
     def get_all(self) -> List[Round]:
         """
@@ -74,8 +85,11 @@ class RoundsManager:
         if self.get_by_id(round_id) is None:
             game_round = Round(round_id, time_created, name,
                                description, playlist_url)
-            self.rounds.append(game_round)
-            self._save_rounds()
+            self._index(game_round)
+            if self.autosave and not self._dirty:
+                self._append_round(game_round)
+            else:
+                self._mark_dirty()
             return game_round
         return None
 
@@ -86,35 +100,86 @@ class RoundsManager:
         """
         game_round = self.get_by_id(round_id)
         if game_round:
-            self.rounds.remove(game_round)
-            self._save_rounds()
+            self._unindex(game_round)
+            self._mark_dirty()
             return True
         return False
 
+    def flush(self) -> None:
+        """
+        Writes pending changes to the CSV file, if there are any.
+        """
+        if self._dirty:
+            self._save_rounds()
+            self._dirty = False
+
+    def close(self) -> None:
+        """
+        Flushes any pending changes. Called automatically when used as a context manager.
+        """
+        self.flush()
+
     ############################################################################
     # Private Methods
     ############################################################################
+    def _mark_dirty(self) -> None:
+        self._dirty = True
+        if self.autosave:
+            self.flush()
+
+    def _index(self, game_round: Round) -> None:
+        self.version += 1
+        self.rounds.append(game_round)
+        self._by_id.setdefault(game_round.id, game_round)
+        self._by_name.setdefault(game_round.name, game_round)
+
+    def _unindex(self, game_round: Round) -> None:
+        self.version += 1
+        self.rounds.remove(game_round)
+        for index, attr in ((self._by_id, 'id'), (self._by_name, 'name')):
+            key = getattr(game_round, attr)
+            if index.get(key) is game_round:
+                del index[key]
+                # Fall back to the next round sharing the key, if any
+                for other in self.rounds:
+                    if getattr(other, attr) == key:
+                        index[key] = other
+                        break
+
     def _save_rounds(self) -> None:
         with open(self.csv_path, 'w', newline='', encoding='utf-8') as csvfile:
             writer = csv.writer(csvfile)
-            writer.writerow(
-                ['ID', 'Created', 'Name', 'Description', 'Playlist URL'])
-            for game_round in self.rounds:
-                writer.writerow(
-                    [game_round.id,
-                     game_round.time_created,
-                     game_round.name,
-                     game_round.description,
-                     game_round.playlist_url]
-                )
+            self._write_header(writer)
+            writer.writerows(self._to_row(game_round)
+                             for game_round in self.rounds)
+
+    def _append_round(self, game_round: Round) -> None:
+        append_csv_row(self.csv_path, self._write_header, self._to_row(game_round))
+
+    @staticmethod
+    def _write_header(writer) -> None:
+        writer.writerow(
+            ['ID', 'Created', 'Name', 'Description', 'Playlist URL'])
+
+    @staticmethod
+    def _to_row(game_round: Round) -> List[str]:
+        return [game_round.id,
+                game_round.time_created,
+                game_round.name,
+                game_round.description,
+                game_round.playlist_url]
 
     def _load_rounds(self) -> None:
         with open(self.csv_path, newline='', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
+            reader = csv.reader(csvfile)
+            header = next(reader, None)
+            if header is None:
+                return
+            columns = itemgetter(*(header.index(name) for name in (
+                'ID', 'Created', 'Name', 'Description', 'Playlist URL')))
             for row in reader:
-                game_round = Round(row['ID'], row['Created'], row['Name'],
-                                   row['Description'], row['Playlist URL'])
-                self.rounds.append(game_round)
+                if row:
+                    self._index(Round(*columns(row)))
 
 
 # Example usage
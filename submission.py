@@ -7,7 +7,12 @@ The CompetitorsManager class manages a list of submissions, allowing for additio
 """
 
 import csv
-from typing import List, Optional
+import sys
+from collections import defaultdict
+from operator import itemgetter
+from typing import Dict, List, Optional
+
+from csv_utils import append_csv_row
 
 
 class Submission:
@@ -15,6 +20,9 @@ class Submission:
     Represents a submission with all relevant fields from the CSV.
     """
 
+    __slots__ = ('spotify_uri', 'title', 'album', 'artists', 'submitter_id',
+                 'created', 'comment', 'round_id', 'visible_to_voters')
+
     def __init__(
         self,
         spotify_uri: str,
@@ -27,14 +35,14 @@ class Submission:
         round_id: str,
         visible_to_voters: str
     ) -> None:
-        self.spotify_uri = spotify_uri
+        self.spotify_uri = sys.intern(spotify_uri)
         self.title = title
         self.album = album
         self.artists = artists
-        self.submitter_id = submitter_id
+        self.submitter_id = sys.intern(submitter_id)
         self.created = created
         self.comment = comment
-        self.round_id = round_id
+        self.round_id = sys.intern(round_id)
         self.visible_to_voters = visible_to_voters
 
     def __repr__(self) -> str:
@@ -53,11 +61,23 @@ class SubmissionsManager:
     # Special Methods
     ############################################################################
 
-    def __init__(self, csv_path: str) -> None:
+    def __init__(self, csv_path: str, autosave: bool = True) -> None:
         self.csv_path = csv_path
+        self.autosave = autosave
         self.submissions: List[Submission] = []
+        self.version = 0
+        self._by_uri: Dict[str, Submission] = {}
+        self._by_submitter: Dict[str, List[Submission]] = defaultdict(list)
+        self._by_round: Dict[str, List[Submission]] = defaultdict(list)
+        self._dirty = False
         self._load_submissions()
 
+    def __enter__(self) -> 'SubmissionsManager':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
     ############################################################################
     # Public Methods
     ############################################################################
@@ -65,22 +85,19 @@ class SubmissionsManager:
         """
         Returns the first Submission with the given Spotify URI, or None if not found.
         """
-        for submission in self.submissions:
-            if submission.spotify_uri == spotify_uri:
-                return submission
-        return None
+        return self._by_uri.get(spotify_uri)
 
     def get_by_submitter_id(self, submitter_id: str) -> List[Submission]:
         """
         Returns all Submissions by the given submitter ID.
         """
-        return [s for s in self.submissions if s.submitter_id == submitter_id]
+        return list(self._by_submitter.get(submitter_id, ()))
 
     def get_by_round_id(self, round_id: str) -> List[Submission]:
         """
         Returns all Submissions for the given round ID.
         """
-        return [s for s in self.submissions if s.round_id == round_id]
+        return list(self._by_round.get(round_id, ()))
 
     def get_all(self) -> List[Submission]:
         """
@@ -107,8 +124,12 @@ class SubmissionsManager:
             submission = Submission(
                 spotify_uri, title, album, artists, submitter_id, created, comment, round_id, visible_to_voters
             )
-            self.submissions.append(submission)
-            self._save_submissions()
+            self._index(submission)
+            if self.autosave and not self._dirty:
+                # The file is otherwise up to date, so appending the one row suffices
+                self._append_submission(submission)
+            else:
+                self._mark_dirty()
             return submission
         return None
 
@@ -119,43 +140,92 @@ class SubmissionsManager:
         """
         submission = self.get_by_spotify_uri(spotify_uri)
         if submission:
-            self.submissions.remove(submission)
-            self._save_submissions()
+            self._unindex(submission)
+            self._mark_dirty()
             return True
         return False
 
+    def flush(self) -> None:
+        """
+        Writes pending changes to the CSV file, if there are any.
+        """
+        if self._dirty:
+            self._save_submissions()
+            self._dirty = False
+
+    def close(self) -> None:
+        """
+        Flushes any pending changes. Called automatically when used as a context manager.
+        """
+        self.flush()
+
     ############################################################################
     # Private Methods
     ############################################################################
+    def _mark_dirty(self) -> None:
+        self._dirty = True
+        if self.autosave:
+            self.flush()
+
+    def _index(self, submission: Submission) -> None:
+        self.version += 1
+        self.submissions.append(submission)
+        self._by_uri.setdefault(submission.spotify_uri, submission)
+        self._by_submitter[submission.submitter_id].append(submission)
+        self._by_round[submission.round_id].append(submission)
+
+    def _unindex(self, submission: Submission) -> None:
+        self.version += 1
+        self.submissions.remove(submission)
+        if self._by_uri.get(submission.spotify_uri) is submission:
+            del self._by_uri[submission.spotify_uri]
+            # Fall back to the next submission sharing the URI, if any
+            for other in self.submissions:
+                if other.spotify_uri == submission.spotify_uri:
+                    self._by_uri[other.spotify_uri] = other
+                    break
+        for index, key in ((self._by_submitter, submission.submitter_id),
+                           (self._by_round, submission.round_id)):
+            bucket = index[key]
+            bucket.remove(submission)
+            if not bucket:
+                del index[key]
+
     def _save_submissions(self) -> None:
         with open(self.csv_path, 'w', newline='', encoding='utf-8') as csvfile:
             writer = csv.writer(csvfile)
-            writer.writerow([
-                'Spotify URI', 'Title', 'Album', 'Artist(s)', 'Submitter ID',
-                'Created', 'Comment', 'Round ID', 'Visible To Voters'
-            ])
-            for s in self.submissions:
-                writer.writerow([
-                    s.spotify_uri, s.title, s.album, s.artists, s.submitter_id,
-                    s.created, s.comment, s.round_id, s.visible_to_voters
-                ])
+            self._write_header(writer)
+            writer.writerows(self._to_row(s) for s in self.submissions)
+
+    def _append_submission(self, submission: Submission) -> None:
+        append_csv_row(self.csv_path, self._write_header, self._to_row(submission))
+
+    @staticmethod
+    def _write_header(writer) -> None:
+        writer.writerow([
+            'Spotify URI', 'Title', 'Album', 'Artist(s)', 'Submitter ID',
+            'Created', 'Comment', 'Round ID', 'Visible To Voters'
+        ])
+
+    @staticmethod
+    def _to_row(s: Submission) -> List[str]:
+        return [
+            s.spotify_uri, s.title, s.album, s.artists, s.submitter_id,
+            s.created, s.comment, s.round_id, s.visible_to_voters
+        ]
 
     def _load_submissions(self) -> None:
         with open(self.csv_path, newline='', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
+            reader = csv.reader(csvfile)
+            header = next(reader, None)
+            if header is None:
+                return
+            columns = itemgetter(*(header.index(name) for name in (
+                'Spotify URI', 'Title', 'Album', 'Artist(s)', 'Submitter ID',
+                'Created', 'Comment', 'Round ID', 'Visible To Voters')))
             for row in reader:
-                submission = Submission(
-                    row['Spotify URI'],
-                    row['Title'],
-                    row['Album'],
-                    row['Artist(s)'],
-                    row['Submitter ID'],
-                    row['Created'],
-                    row['Comment'],
-                    row['Round ID'],
-                    row['Visible To Voters']
-                )
-                self.submissions.append(submission)
+                if row:
+                    self._index(Submission(*columns(row)))
 
 
 # Example usage
@@ -7,7 +7,16 @@ The VotesManager class manages a list of votes, allowing for addition, removal,
 """
 
 import csv
-from typing import List, Optional
+import sys
+from collections import defaultdict
+from operator import itemgetter
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from csv_utils import append_csv_row
+
+# Large read/write buffer for whole-file CSV passes, cutting read()/write()
+# syscalls on big vote exports
+CSV_BUFFER_SIZE = 1 << 20
 
 
 class Vote:
@@ -15,6 +24,9 @@ class Vote:
     Represents a vote with all relevant fields from the CSV.
     """
 
+    __slots__ = ('spotify_uri', 'voter_id', 'created',
+                 'points_assigned', 'points', 'comment', 'round_id', 'seq')
+
     def __init__(
         self,
         spotify_uri: str,
@@ -24,17 +36,25 @@ class Vote:
         comment: str,
         round_id: str
     ) -> None:
-        self.spotify_uri = spotify_uri
-        self.voter_id = voter_id
+        self.spotify_uri = sys.intern(spotify_uri)
+        self.voter_id = sys.intern(voter_id)
         self.created = created
         self.points_assigned = points_assigned
+        # Parsed once here so aggregations don't re-parse the string;
+        # anything that isn't a plain non-negative integer is None, and
+        # point tallies skip it.
+        self.points: Optional[int] = int(points_assigned) if str(
+            points_assigned).isdigit() else None
         self.comment = comment
-        self.round_id = round_id
+        self.round_id = sys.intern(round_id)
+        # Insertion order within the manager, set when the vote is indexed,
+        # so votes drawn from several index buckets can be put in file order
+        self.seq = 0
 
     def __repr__(self) -> str:
         return (
-            f"Vote(spotify_uri='{self.spotify_uri}', voter_id='{self.voter_id}', created='{self.created}', "
-            f"points_assigned='{self.points_assigned}', comment='{self.comment}', round_id='{self.round_id}')"
+            "Vote(spotify_uri=%r, voter_id=%r, created=%r, points_assigned=%r, comment=%r, round_id=%r)"
+            % (self.spotify_uri, self.voter_id, self.created, self.points_assigned, self.comment, self.round_id)
         )
 
 
@@ -49,35 +69,83 @@ class VotesManager:
     def __init__(self, csv_path: str) -> None:
         self.csv_path = csv_path
         self.votes: List[Vote] = []
-        self._load_votes()
+        # Bumped on every add/remove so dependants can tell when to recompute
+        self.version = 0
+        self._next_seq = 0
+        self._by_uri: Dict[str, List[Vote]] = defaultdict(list)
+        self._by_voter: Dict[str, List[Vote]] = defaultdict(list)
+        self._by_round: Dict[str, List[Vote]] = defaultdict(list)
+        self._by_key: Dict[Tuple[str, str, str], Vote] = {}
+        # The CSV is parsed on first query rather than here, so callers that
+        # only append votes never pay for loading the existing ones.
+        self._loaded = False
+
+    def __repr__(self) -> str:
+        # Summarise rather than repr every vote, which is slow for large files
+        count = len(self.votes) if self._loaded else 'not loaded'
+        return f"VotesManager(csv_path='{self.csv_path}', votes={count})"
 
     ############################################################################
     # Public Methods
     ############################################################################
-    def get_by_spotify_uri(self, spotify_uri: str) -> List[Vote]:
+    def get_by_spotify_uri(self, spotify_uri: str) -> Iterator[Vote]:
         """
-        Returns all votes for the given Spotify URI.
+        Returns an iterator over all votes for the given Spotify URI.
+        The iterator reads the live index, so wrap it in list() before
+        adding or removing votes while iterating.
         """
-        return [v for v in self.votes if v.spotify_uri == spotify_uri]
+        self._ensure_loaded()
+        return iter(self._by_uri.get(spotify_uri, ()))
 
-    def get_by_voter_id(self, voter_id: str) -> List[Vote]:
+    def get_by_voter_id(self, voter_id: str) -> Iterator[Vote]:
         """
-        Returns all votes by the given voter ID.
+        Returns an iterator over all votes by the given voter ID.
+        The iterator reads the live index, so wrap it in list() before
+        adding or removing votes while iterating.
         """
-        return [v for v in self.votes if v.voter_id == voter_id]
+        self._ensure_loaded()
+        return iter(self._by_voter.get(voter_id, ()))
 
-    def get_by_round_id(self, round_id: str) -> List[Vote]:
+    def get_by_round_id(self, round_id: str) -> Iterator[Vote]:
         """
-        Returns all votes for the given round ID.
+        Returns an iterator over all votes for the given round ID.
+        The iterator reads the live index, so wrap it in list() before
+        adding or removing votes while iterating.
         """
-        return [v for v in self.votes if v.round_id == round_id]
+        self._ensure_loaded()
+        return iter(self._by_round.get(round_id, ()))
 
     def get_all(self) -> List[Vote]:
         """
         Returns a list of all votes.
         """
+        self._ensure_loaded()
         return self.votes
 
+    def count_by_uri(self) -> Dict[str, int]:
+        """
+        Returns a dict mapping Spotify URI to the number of votes it received.
+        """
+        self._ensure_loaded()
+        return {uri: len(votes) for uri, votes in self._by_uri.items()}
+
+    @classmethod
+    def stream_votes(cls, csv_path: str) -> Iterator[Vote]:
+        """
+        Yields votes from the given CSV one row at a time, without building
+        a VotesManager. Useful for one-off passes over very large files.
+        """
+        with open(csv_path, newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as csvfile:
+            reader = csv.reader(csvfile)
+            header = next(reader, None)
+            if header is None:
+                return
+            columns = itemgetter(*(header.index(name) for name in (
+                'Spotify URI', 'Voter ID', 'Created', 'Points Assigned', 'Comment', 'Round ID')))
+            for row in reader:
+                if row:
+                    yield Vote(*columns(row))
+
     def add_vote(
         self,
         spotify_uri: str,
@@ -89,11 +157,16 @@ class VotesManager:
     ) -> Vote:
         """
         Adds a new vote with the given details.
+        If the votes haven't been loaded yet, the vote is only appended to the
+        file and the returned Vote is a detached snapshot: the manager loads
+        its own copy later, so edits to the returned object are not saved.
         """
         vote = Vote(spotify_uri, voter_id, created,
                     points_assigned, comment, round_id)
-        self.votes.append(vote)
-        self._save_votes()
+        if self._loaded:
+            self._index(vote)
+        # Otherwise the vote is picked up from the file when it is loaded
+        self._append_vote(vote)
         return vote
 
     def remove_vote(self, spotify_uri: str, voter_id: str, round_id: str) -> bool:
@@ -101,44 +174,86 @@ class VotesManager:
         Removes the vote with the given Spotify URI, voter ID, and round ID.
         Returns True if removed, False if not found.
         """
-        for vote in self.votes:
-            if (
-                vote.spotify_uri == spotify_uri and
-                vote.voter_id == voter_id and
-                vote.round_id == round_id
-            ):
-                self.votes.remove(vote)
-                self._save_votes()
-                return True
-        return False
+        self._ensure_loaded()
+        vote = self._by_key.get((spotify_uri, voter_id, round_id))
+        if vote is None:
+            return False
+        self._unindex(vote)
+        self._save_votes()
+        return True
 
     ############################################################################
     # Private Methods
     ############################################################################
+    def _ensure_loaded(self) -> None:
+        if not self._loaded:
+            # Only mark as loaded once parsing succeeds, so a failed load is
+            # retried (and raises again) rather than leaving an empty manager
+            # that a later save would write over the file.
+            self._load_votes()
+            self._loaded = True
+
+    def _index(self, vote: Vote) -> None:
+        self.version += 1
+        self.votes.append(vote)
+        self._add_lookups(vote)
+
+    def _add_lookups(self, vote: Vote) -> None:
+        vote.seq = self._next_seq
+        self._next_seq += 1
+        self._by_uri[vote.spotify_uri].append(vote)
+        self._by_voter[vote.voter_id].append(vote)
+        self._by_round[vote.round_id].append(vote)
+        self._by_key.setdefault(self._key(vote), vote)
+
+    def _unindex(self, vote: Vote) -> None:
+        self.version += 1
+        self.votes.remove(vote)
+        for index, key in ((self._by_uri, vote.spotify_uri),
+                           (self._by_voter, vote.voter_id),
+                           (self._by_round, vote.round_id)):
+            bucket = index[key]
+            bucket.remove(vote)
+            if not bucket:
+                del index[key]
+        key = self._key(vote)
+        if self._by_key.get(key) is vote:
+            del self._by_key[key]
+            # Fall back to a remaining duplicate of the same vote, if any
+            for other in self._by_uri.get(vote.spotify_uri, ()):
+                if self._key(other) == key:
+                    self._by_key[key] = other
+                    break
+
+    @staticmethod
+    def _key(vote: Vote) -> Tuple[str, str, str]:
+        return vote.spotify_uri, vote.voter_id, vote.round_id
+
     def _save_votes(self) -> None:
-        with open(self.csv_path, 'w', newline='', encoding='utf-8') as csvfile:
+        with open(self.csv_path, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as csvfile:
             writer = csv.writer(csvfile)
-            writer.writerow([
-                'Spotify URI', 'Voter ID', 'Created', 'Points Assigned', 'Comment', 'Round ID'
-            ])
-            for v in self.votes:
-                writer.writerow([
-                    v.spotify_uri, v.voter_id, v.created, v.points_assigned, v.comment, v.round_id
-                ])
+            self._write_header(writer)
+            writer.writerows(self._to_row(v) for v in self.votes)
+
+    def _append_vote(self, vote: Vote) -> None:
+        append_csv_row(self.csv_path, self._write_header, self._to_row(vote))
+
+    @staticmethod
+    def _write_header(writer) -> None:
+        writer.writerow([
+            'Spotify URI', 'Voter ID', 'Created', 'Points Assigned', 'Comment', 'Round ID'
+        ])
+
+    @staticmethod
+    def _to_row(v: Vote) -> Tuple[str, str, str, str, str, str]:
+        return v.spotify_uri, v.voter_id, v.created, v.points_assigned, v.comment, v.round_id
 
     def _load_votes(self) -> None:
-        with open(self.csv_path, newline='', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                vote = Vote(
-                    row['Spotify URI'],
-                    row['Voter ID'],
-                    row['Created'],
-                    row['Points Assigned'],
-                    row['Comment'],
-                    row['Round ID']
-                )
-                self.votes.append(vote)
+        loaded = list(self.stream_votes(self.csv_path))
+        self.version += 1
+        self.votes.extend(loaded)
+        for vote in loaded:
+            self._add_lookups(vote)
 
 
 # Example usage